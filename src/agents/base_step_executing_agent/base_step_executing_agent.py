@@ -201,7 +201,7 @@ class BaseStepExecutingAgent(BaseReactAgent):
                 }
             )
             if self.name == Node.RUNNER_AGENT.value:
-                step.assigned_agent = Node.RUNNER_AGENT
+                step = step.model_copy(update={"assigned_agent": Node.RUNNER_AGENT})
 
             finished_steps.append(
                 FinishedStep(step=step, output=shell.get_step_buffer())
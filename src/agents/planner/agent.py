@@ -140,7 +140,9 @@ class Planner(BaseReactAgent):
         )
         plan = state.get("plan") or deque()
         planned_steps = self._assign_shells(analysis.plan)
-        state["plan"] = deque(planned_steps) + plan
+        # Prepend in place; building a new deque would copy the whole remaining plan.
+        plan.extendleft(reversed(planned_steps))
+        state["plan"] = plan
         state["errors"] = []
         return state
 
@@ -166,7 +168,8 @@ class Planner(BaseReactAgent):
         plan = state.get("plan") or deque()
 
         planned_steps = self._assign_shells(analysis.plan)
-        state["plan"] = deque(planned_steps) + plan
+        plan.extendleft(reversed(planned_steps))
+        state["plan"] = plan
 
         state["failed_steps"] = []
         return state
@@ -181,11 +184,17 @@ class Planner(BaseReactAgent):
         Returns:
             List[Step]: Updated list of steps with shell IDs assigned where needed.
         """
-        for step in steps:
-            if step.run_in_separate_shell:
-                step.substeps = [self.cd_substep] + step.substeps
-                step.shell_id = self.shell_registry.register_new_shell()
-        return steps
+        return [
+            step.model_copy(
+                update={
+                    "substeps": [self.cd_substep] + step.substeps,
+                    "shell_id": self.shell_registry.register_new_shell(),
+                }
+            )
+            if step.run_in_separate_shell
+            else step
+            for step in steps
+        ]
 
     def _decide_next_agent(self, state: GraphState) -> GraphState:
         """
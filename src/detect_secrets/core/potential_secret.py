@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional, Tuple
 
 
 class PotentialSecret:
@@ -17,12 +17,20 @@ class PotentialSecret:
         secret_value (str): The identified secret
         is_secret (Optional[bool]): Indicates whether the secret is a true or false positive
         is_verified (bool): It tells whether the secret has been externally verified or not
-        fields_to_compare (list[str]): List of field names that are considered while comparing,
+        entropy (Optional[float]): Shannon entropy of the secret, cached by plugins that
+                                   compute it while scanning. None if not computed.
+        fields_to_compare (tuple[str, ...]): Field names that are considered while comparing,
                                         such as 'secret_value', 'secret_type'.
                                         Note that line numbers are not included in this,
                                         because line numbers can change.
     """
 
+    __slots__ = ("secret_type", "secret_value", "is_secret", "is_verified", "entropy")
+
+    # If two PotentialSecrets have the same values for these fields,
+    # they are considered equal.
+    fields_to_compare: ClassVar[Tuple[str, ...]] = ("secret_value", "secret_type")
+
     def __init__(
         self,
         secret_type: str,
@@ -44,10 +52,7 @@ class PotentialSecret:
         self.secret_value = secret
         self.is_secret = is_secret
         self.is_verified = is_verified
-
-        # If two PotentialSecrets have the same values for these fields,
-        # they are considered equal.
-        self.fields_to_compare = ["secret_value", "secret_type"]
+        self.entropy: Optional[float] = None
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, PotentialSecret):
@@ -1,4 +1,4 @@
-from typing import Any, Generator, List
+from typing import Any, Generator, Iterable
 
 from detect_secrets.core.potential_secret import PotentialSecret
 from detect_secrets.plugins.base import BasePlugin
@@ -6,31 +6,24 @@ from detect_secrets.settings import get_filters
 
 
 def scan_line(
-    line: str, plugins: List[BasePlugin]
+    line: str, plugins: Iterable[BasePlugin]
 ) -> Generator[PotentialSecret, None, None]:
     """
     Function for adhoc string scanning.
 
     Args:
         line (str): String to scan.
-        plugins (List[BasePlugin]): List of plugins to use for scanning.
+        plugins (Iterable[BasePlugin]): Plugins to use for scanning.
 
     Returns:
         Generator[PotentialSecret, None, None]: Generator of PotentialSecret objects.
     """
-    yield from (
-        secret
-        for plugin in plugins
-        for secret in _scan_line(
+    for plugin in plugins:
+        yield from _scan_line(
             plugin=plugin,
             line=line,
             enable_eager_search=True,
         )
-        if not _is_filtered_out(
-            secret=secret.secret_value,
-            plugin=plugin,
-        )
-    )
 
 
 def _scan_line(
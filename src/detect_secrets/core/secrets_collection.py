@@ -16,11 +16,14 @@ class SecretsCollection:
             List[PotentialSecretResult]: List of results from the secret check.
         """
         plugins = get_plugins()
-        secrets = scan.scan_line(text, plugins=plugins)
-        result: List[PotentialSecretResult] = []
+        plugins_by_type = {plugin.secret_type: plugin for plugin in plugins}
+        # Plugins report every match they find; duplicates are dropped once here.
+        secrets = {
+            (secret.secret_type, secret.secret_value): secret
+            for secret in scan.scan_line(text, plugins=plugins)
+        }
 
-        for secret in secrets:
-            plugin = [p for p in plugins if p.secret_type == secret.secret_type][0]
-            result.append(plugin.prepare_secret_result(secret=secret))
-
-        return result
+        return [
+            plugins_by_type[secret.secret_type].prepare_secret_result(secret=secret)
+            for secret in secrets.values()
+        ]
@@ -3,7 +3,7 @@ This plugin searches for Azure Storage Account access keys.
 """
 
 import re
-from typing import List, Pattern
+from typing import Pattern, Tuple
 
 from detect_secrets.plugins.base import RegexBasedDetector
 
@@ -11,26 +11,13 @@ from detect_secrets.plugins.base import RegexBasedDetector
 class AzureStorageKeyDetector(RegexBasedDetector):
     """Scans for Azure Storage Account access keys."""
 
-    @property
-    def secret_type(self) -> str:
-        """Returns the secret type identifier.
+    secret_type = "Azure Storage Account access key"
 
-        Returns:
-            str: The string identifier 'Azure Storage Account access key'.
-        """
-        return "Azure Storage Account access key"
+    required_substrings = ("AccountKey=",)
 
-    @property
-    def denylist(self) -> List[Pattern]:
-        """Returns the list of regex patterns to search for.
-
-        The patterns look for:
-        1. Azure Storage connection strings containing 'AccountKey='.
-
-        Returns:
-            List[Pattern]: A list of compiled regular expression patterns.
-        """
-        return [
-            # Account Key (AccountKey=xxxxxxxxx)
-            re.compile(r"AccountKey=[a-zA-Z0-9+\/=]{88}"),
-        ]
+    # The patterns look for:
+    # 1. Azure Storage connection strings containing 'AccountKey='.
+    denylist: Tuple[Pattern, ...] = (
+        # Account Key (AccountKey=xxxxxxxxx)
+        re.compile(r"AccountKey=[a-zA-Z0-9+\/=]{88}"),
+    )
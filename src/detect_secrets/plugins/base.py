@@ -7,7 +7,18 @@ things may not work as you expect (see the scan logic in SecretsCollection).
 
 import re
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, Generator, Iterable, Optional, Pattern, Set, TypedDict
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    TypedDict,
+)
 
 from detect_secrets.core.potential_secret import PotentialSecret
 
@@ -27,7 +38,16 @@ class PotentialSecretResult(TypedDict):
 
 
 class BasePlugin(metaclass=ABCMeta):
-    """Abstract base class for all plugins."""
+    """Abstract base class for all plugins.
+
+    Subclasses define `secret_type` as a class attribute.
+    """
+
+    _json: Dict[str, Any]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._json = {"name": cls.__name__}
 
     @property
     @abstractmethod
@@ -52,38 +72,35 @@ class BasePlugin(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
-    def analyze_line(self, line: str, **kwargs: Any) -> Set[PotentialSecret]:
+    def analyze_line(self, line: str, **kwargs: Any) -> List[PotentialSecret]:
         """Examines a line and finds all possible secret values in it.
 
+        The result is not deduplicated; `SecretsCollection` does that once for
+        all plugins.
+
         Args:
             line (str): The line of text to analyze.
             **kwargs: Arbitrary keyword arguments passed to analyze_string.
 
         Returns:
-            Set[PotentialSecret]: A set of PotentialSecret objects found in the line.
+            List[PotentialSecret]: A list of PotentialSecret objects found in the line.
         """
-        output = set()
-        for match in self.analyze_string(line, **kwargs):
-            is_verified: bool = False
-            output.add(
-                PotentialSecret(
-                    secret_type=self.secret_type,
-                    secret=match,
-                    is_verified=is_verified,
-                ),
-            )
-
-        return output
+        secret_type = self.secret_type
+        return [
+            PotentialSecret(secret_type, match)
+            for match in self.analyze_string(line, **kwargs)
+        ]
 
     def json(self) -> Dict[str, Any]:
         """Returns a JSON-serializable representation of the plugin.
 
+        The dictionary is built once per plugin class and shared, so it must not
+        be modified.
+
         Returns:
             Dict[str, Any]: A dictionary containing the class name.
         """
-        return {
-            "name": self.__class__.__name__,
-        }
+        return self._json
 
     def prepare_secret_result(self, secret: PotentialSecret) -> PotentialSecretResult:
         """Prepare any data structures needed for formatting results.
@@ -94,23 +111,9 @@ class BasePlugin(metaclass=ABCMeta):
         Returns:
             PotentialSecretResult: A dictionary containing the formatted secret details.
         """
-        if not secret.secret_value and not secret.is_verified:
-            return {
-                "is_secret": True,
-                "secret_value": None,
-                "secret_type": secret.secret_type,
-            }
-
-        if secret.is_verified:
-            return {
-                "is_secret": True,
-                "secret_value": secret.secret_value,
-                "secret_type": secret.secret_type,
-            }
-
         return {
             "is_secret": True,
-            "secret_value": None,
+            "secret_value": secret.secret_value if secret.is_verified else None,
             "secret_type": secret.secret_type,
         }
 
@@ -133,11 +136,34 @@ class BasePlugin(metaclass=ABCMeta):
         return self.json() == other.json()
 
 
+# The argument-independent part of `RegexBasedDetector.build_assignment_regex`,
+# assembled once at import time.
+_ASSIGNMENT_REGEX_TEMPLATE = (
+    r"{begin}{opt_open_square_bracket}{opt_quote}{{prefix_regex}}{opt_dash_underscore}"
+    "{{secret_keyword_regex}}{opt_quote}{opt_close_square_bracket}{opt_space}"
+    "{assignment}{opt_space}{opt_quote}{{secret_regex}}{opt_quote}".format(
+        begin=r"(?<!\w)",
+        opt_open_square_bracket=r"\[?",
+        opt_quote=r'["\']?',
+        opt_dash_underscore=r"[-_]?",
+        opt_close_square_bracket=r"\]?",
+        opt_space=r"(?: *)",
+        assignment=r"(?:=|:|:=|=>| +|::)",
+    )
+)
+
+
 class RegexBasedDetector(BasePlugin, metaclass=ABCMeta):
     """Parent class for regular-expression based detectors.
 
     To create a new regex-based detector, subclass this and set `secret_type` with a
     description and `denylist` with a sequence of *compiled* regular expressions.
+    Each pattern has at most one capturing group: the secret is that group when
+    present, and the whole match otherwise.
+
+    Detectors whose every pattern requires one of a few case-sensitive literals can
+    list them in `required_substrings`; strings containing none of them are skipped
+    without running the regexes.
 
     Example:
         class FooDetector(RegexBasedDetector):
@@ -157,6 +183,8 @@ class RegexBasedDetector(BasePlugin, metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    required_substrings: Tuple[str, ...] = ()
+
     def analyze_string(self, string: str, **kwargs) -> Generator[str, None, None]:
         """Analyzes a string using the defined denylist regex patterns.
 
@@ -167,15 +195,16 @@ class RegexBasedDetector(BasePlugin, metaclass=ABCMeta):
         Yields:
             str: Strings matching the denylist patterns.
         """
+        if self.required_substrings and not any(
+            substring in string for substring in self.required_substrings
+        ):
+            return
+
         for regex in self.denylist:
-            for match in regex.findall(string):
-                if isinstance(match, tuple):
-                    for submatch in filter(bool, match):
-                        yield submatch
-                else:
-                    yield match
+            yield from regex.findall(string)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def build_assignment_regex(
         prefix_regex: str,
         secret_keyword_regex: str,
@@ -199,29 +228,15 @@ class RegexBasedDetector(BasePlugin, metaclass=ABCMeta):
             secret_keyword_regex (str): Regex for the keyword indicating a secret.
             secret_regex (str): Regex for the actual secret value.
 
+        Calls with the same arguments return the same compiled pattern.
+
         Returns:
             Pattern: A compiled regular expression object ignoring case.
         """
-        begin = r"(?:(?<=\W)|(?<=^))"
-        opt_quote = r'(?:"|\'|)'
-        opt_open_square_bracket = r"(?:\[|)"
-        opt_close_square_bracket = r"(?:\]|)"
-        opt_dash_underscore = r"(?:_|-|)"
-        opt_space = r"(?: *)"
-        assignment = r"(?:=|:|:=|=>| +|::)"
         return re.compile(
-            r"{begin}{opt_open_square_bracket}{opt_quote}{prefix_regex}{opt_dash_underscore}"
-            "{secret_keyword_regex}{opt_quote}{opt_close_square_bracket}{opt_space}"
-            "{assignment}{opt_space}{opt_quote}{secret_regex}{opt_quote}".format(
-                begin=begin,
-                opt_open_square_bracket=opt_open_square_bracket,
-                opt_quote=opt_quote,
+            _ASSIGNMENT_REGEX_TEMPLATE.format(
                 prefix_regex=prefix_regex,
-                opt_dash_underscore=opt_dash_underscore,
                 secret_keyword_regex=secret_keyword_regex,
-                opt_close_square_bracket=opt_close_square_bracket,
-                opt_space=opt_space,
-                assignment=assignment,
                 secret_regex=secret_regex,
             ),
             flags=re.IGNORECASE,
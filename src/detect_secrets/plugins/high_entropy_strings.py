@@ -2,8 +2,9 @@ import math
 import re
 import string
 from abc import ABCMeta
-from contextlib import contextmanager
-from typing import Any, Dict, Generator, Set, cast
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Generator, List, Optional, Pattern, cast
 
 from detect_secrets.core.potential_secret import PotentialSecret
 from detect_secrets.plugins.base import BasePlugin, PotentialSecretResult
@@ -19,6 +20,38 @@ class PotentialSecretResultWithEntropy(PotentialSecretResult):
     entropy: float
 
 
+@lru_cache(maxsize=16)
+def _quoted_string_regex(charset: str) -> Pattern:
+    """Compiles the regex for quoted runs of `charset`, shared by all instances.
+
+    Args:
+        charset (str): The characters allowed in the secret.
+
+    Returns:
+        Pattern: A pattern capturing the opening quote, the run, and the closing quote.
+    """
+    # NOTE: We need this to be a capturing group, so back-reference can work.
+    # The charset never contains a quote, so the run is possessive: giving characters
+    # back cannot produce the closing quote, and an unterminated run fails at once.
+    return re.compile(r'([\'"])([{}]++)(\1)'.format(re.escape(charset)))
+
+
+@lru_cache(maxsize=16)
+def _non_quoted_string_regex(charset: str) -> Pattern:
+    """Compiles the regex for unquoted runs of `charset`, shared by all instances.
+
+    For certain inputs, strings need not necessarily follow the normal convention
+    of being denoted by single or double quotes.
+
+    Args:
+        charset (str): The characters allowed in the secret.
+
+    Returns:
+        Pattern: A pattern capturing the run, wherever it appears in the string.
+    """
+    return re.compile(r"([{}]+)".format(re.escape(charset)))
+
+
 class HighEntropyStringsPlugin(BasePlugin, metaclass=ABCMeta):
     """Base class for plugins that detect secrets based on information density (entropy)."""
 
@@ -41,20 +74,23 @@ class HighEntropyStringsPlugin(BasePlugin, metaclass=ABCMeta):
         self.entropy_limit = limit
 
         # We require quoted strings to reduce noise.
-        # NOTE: We need this to be a capturing group, so back-reference can work.
-        self.regex = re.compile(r'([\'"])([{}]+)(\1)'.format(re.escape(charset)))
+        self.regex = _quoted_string_regex(charset)
 
-    def analyze_string(self, string: str, **kwargs: Any) -> Generator[str, None, None]:
+    def analyze_string(
+        self, string: str, regex: Optional[Pattern] = None, **kwargs: Any
+    ) -> Generator[str, None, None]:
         """Finds candidate strings that match the charset within quotes.
 
         Args:
             string (str): The text content to analyze.
+            regex (Optional[Pattern]): Pattern to search with instead of the quoted-string
+                regex. Defaults to None.
             **kwargs: Arbitrary keyword arguments.
 
         Yields:
             str: The candidate string content (without quotes).
         """
-        for result in self.regex.findall(string):
+        for result in (regex or self.regex).findall(string):
             if isinstance(result, tuple):
                 # This occurs on the default regex, but not on the eager regex.
                 result = result[1]
@@ -66,7 +102,7 @@ class HighEntropyStringsPlugin(BasePlugin, metaclass=ABCMeta):
 
     def analyze_line(
         self, line: str, enable_eager_search: bool = False, **kwargs
-    ) -> Set[PotentialSecret]:
+    ) -> List[PotentialSecret]:
         """Examines a line and filters results based on entropy limits.
 
         Args:
@@ -77,23 +113,34 @@ class HighEntropyStringsPlugin(BasePlugin, metaclass=ABCMeta):
             **kwargs: Arbitrary keyword arguments.
 
         Returns:
-            Set[PotentialSecret]: A set of verified PotentialSecret objects.
+            List[PotentialSecret]: A list of verified PotentialSecret objects.
         """
-        output = super().analyze_line(
-            line=line,
-        )
-        if output or not enable_eager_search:
+        candidates = list(self.analyze_string(line))
+        if candidates or not enable_eager_search:
             # NOTE: We perform the limit filter at this layer (rather than analyze_string) so
             # that we can surface secrets that do not meet the limit criteria when
-            # enable_eager_search=True.
-            return {
-                secret
-                for secret in (output or set())
-                if (
-                    self.calculate_shannon_entropy(cast(str, secret.secret_value))
-                    > self.entropy_limit
-                )
-            }
+            # enable_eager_search=True. Candidates are filtered before PotentialSecrets are
+            # built, so rejected ones are never allocated.
+            # Repeated candidates (common in lockfiles and minified code) are scored once.
+            #
+            # The entropy of a string of length n is at most log2(n), so candidates
+            # shorter than 2 ** limit cannot pass and are dropped without being scored.
+            min_length = 2**self.entropy_limit
+            entropies: Dict[str, float] = {}
+            for value in candidates:
+                if value not in entropies and len(value) >= min_length:
+                    entropies[value] = self.calculate_shannon_entropy(value)
+
+            secret_type = self.secret_type
+            secrets = []
+            for value in candidates:
+                entropy = entropies.get(value)
+                if entropy is not None and entropy > self.entropy_limit:
+                    secret = PotentialSecret(secret_type, value)
+                    secret.entropy = entropy
+                    secrets.append(secret)
+
+            return secrets
 
         # This is mainly used for adhoc string scanning. As such, it's just bad UX to require
         # quotes around the expected secret. In these cases, we only try to search it without
@@ -102,8 +149,10 @@ class HighEntropyStringsPlugin(BasePlugin, metaclass=ABCMeta):
         # NOTE: Since we currently assume this is only used for adhoc string scanning, we
         # perform the limit filtering outside this function. This allows us to see *why* secrets
         # have failed to be caught with our configured limit.
-        with self.non_quoted_string_regex(is_exact_match=False):
-            return super().analyze_line(line=line)
+        return super().analyze_line(
+            line=line,
+            regex=_non_quoted_string_regex(self.charset),
+        )
 
     def calculate_shannon_entropy(self, data: str) -> float:
         """Returns the Shannon entropy of a given string.
@@ -121,11 +170,14 @@ class HighEntropyStringsPlugin(BasePlugin, metaclass=ABCMeta):
         if not data:
             return 0
 
+        # A single counting pass over `data`; characters outside the charset do not
+        # contribute, as before.
+        length = len(data)
         entropy = 0.0
-        for x in self.charset:
-            p_x = float(data.count(x)) / len(data)
-            if p_x > 0:
-                entropy += -p_x * math.log(p_x, 2)
+        for char, count in Counter(data).items():
+            if char in self.charset:
+                p_x = count / length
+                entropy -= p_x * math.log2(p_x)
 
         return entropy
 
@@ -140,9 +192,10 @@ class HighEntropyStringsPlugin(BasePlugin, metaclass=ABCMeta):
         Returns:
             PotentialSecretResultWithEntropy: The result dictionary containing entropy.
         """
-        entropy = round(
-            self.calculate_shannon_entropy(cast(str, secret.secret_value)), 3
-        )
+        entropy = secret.entropy
+        if entropy is None:
+            entropy = self.calculate_shannon_entropy(cast(str, secret.secret_value))
+        entropy = round(entropy, 3)
         is_secret = entropy > self.entropy_limit
 
         return {
@@ -193,48 +246,11 @@ class HighEntropyStringsPlugin(BasePlugin, metaclass=ABCMeta):
             "limit": self.entropy_limit,
         }
 
-    @contextmanager
-    def non_quoted_string_regex(
-        self, is_exact_match: bool = True
-    ) -> Generator[None, None, None]:
-        """Context manager to temporarily allow scanning without quotes.
-
-        For certain file formats, strings need not necessarily follow the
-        normal convention of being denoted by single or double quotes.
-
-        Args:
-            is_exact_match (bool): If True, modifies regex to match the exact string
-                anchored to start/end. If False, allows finding the secret embedded
-                within a line. Defaults to True.
-
-        Yields:
-            None: Context manager yield.
-        """
-        old_regex = self.regex
-
-        regex_alternative = r"([{}]+)".format(re.escape(self.charset))
-        if is_exact_match:
-            regex_alternative = r"^" + regex_alternative + r"$"
-
-        self.regex = re.compile(regex_alternative)
-
-        try:
-            yield
-        finally:
-            self.regex = old_regex
-
 
 class Base64HighEntropyString(HighEntropyStringsPlugin):
     """Scans for random-looking base64 encoded strings."""
 
-    @property
-    def secret_type(self) -> str:
-        """Returns the secret type identifier.
-
-        Returns:
-            str: 'Base64 High Entropy String'.
-        """
-        return "Base64 High Entropy String"
+    secret_type = "Base64 High Entropy String"
 
     def __init__(self, limit: float = 4.5) -> None:
         """Initializes the plugin with Base64 charset.
@@ -257,14 +273,7 @@ class Base64HighEntropyString(HighEntropyStringsPlugin):
 class HexHighEntropyString(HighEntropyStringsPlugin):
     """Scans for random-looking hex encoded strings."""
 
-    @property
-    def secret_type(self) -> str:
-        """Returns the secret type identifier.
-
-        Returns:
-            str: 'Hex High Entropy String'.
-        """
-        return "Hex High Entropy String"
+    secret_type = "Hex High Entropy String"
 
     def __init__(self, limit: float = 3.0) -> None:
         """Initializes the plugin with Hex charset.
@@ -309,14 +318,10 @@ class HexHighEntropyString(HighEntropyStringsPlugin):
         if len(data) == 1:
             return entropy
 
-        try:
-            # Check if str is that of a number
-            int(data)
-
+        # Check if str is that of a number
+        if data.isdecimal():
             # This multiplier was determined through trial and error, with the
             # intent of keeping it simple, yet achieving our goals.
-            entropy -= 1.2 / math.log(len(data), 2)
-        except ValueError:
-            pass
+            entropy -= 1.2 / math.log2(len(data))
 
         return entropy
@@ -1,7 +1,7 @@
 """This plugin searches for Public IP addresses."""
 
 import re
-from typing import List, Pattern
+from typing import Generator, Pattern, Tuple
 
 from detect_secrets.plugins.base import RegexBasedDetector
 
@@ -25,48 +25,63 @@ class IPPublicDetector(RegexBasedDetector):
         - https://en.wikipedia.org/wiki/Private_network
     """
 
-    @property
-    def secret_type(self) -> str:
-        """Returns the secret type identifier.
-
-        Returns:
-            str: The string identifier 'Public IP (ipv4)'.
-        """
-        return "Public IP (ipv4)"
+    secret_type = "Public IP (ipv4)"
 
     denylist_ipv4_address = r"""
+        (?=\d)             # Cheap first test: every address starts with a digit
         (?<![\w.])         # Negative lookbehind: Ensures no preceding word character or dot
-        (                  # Start of the main capturing group
-            (?!            # Negative lookahead: Ensures the following pattern doesn't match
-                192\.168\. # Exclude "192.168."
-                |127\.     # Exclude "127."
-                |10\.      # Exclude "10."
-                |169\.254\. # Exclude IPv4 Link Local Address (169.254.0.0/16)
-                |172\.(?:1[6-9]|2[0-9]|3[01])   # Exclude "172." with specific ranges
-            )
-            (?:            # Non-capturing group for octets
+        (?:                # Non-capturing group for octets
                            # Match numbers 0-255 followed by dot, properly handle leading zeros
-                (?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9][0-9]|[0-9])\.
-            ){3}           # Repeat for three octets
+            (?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9][0-9]|[0-9])\.
+        ){3}               # Repeat for three octets
                            # Match final octet (0-255), properly handle leading zeros
-            (?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9][0-9]|[0-9])
-            (?:            # Optional non-capturing group for port number
-                :\d{1,5}   # Match colon followed by 1 to 5 digits
-            )?
-        )                  # End of the main capturing group
+        (?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9][0-9]|[0-9])
+        (?:                # Optional non-capturing group for port number
+            :\d{1,5}       # Match colon followed by 1 to 5 digits
+        )?
         (?![\w.])          # Negative lookahead: Ensures no following word character or dot
     """
 
-    @property
-    def denylist(self) -> List[Pattern]:
-        """Returns the list of regex patterns to search for.
+    # The regex matches any IPv4 address; private and reserved ranges (RFC 1918,
+    # RFC 3927) are excluded afterwards by `is_public`.
+    denylist: Tuple[Pattern, ...] = (
+        re.compile(denylist_ipv4_address, flags=re.VERBOSE),
+    )
+
+    def analyze_string(self, string: str, **kwargs) -> Generator[str, None, None]:
+        """Yields public IPv4 addresses found in the string.
+
+        This overrides the parent method to drop matches in the excluded ranges,
+        which is cheaper than ruling them out inside the regex at every position.
+
+        Args:
+            string (str): The content to analyze.
+            **kwargs: Arbitrary keyword arguments.
+
+        Yields:
+            str: Public IPv4 addresses, with the port if present.
+        """
+        yield from filter(
+            self.is_public,
+            super().analyze_string(string),
+        )
+
+    @staticmethod
+    def is_public(address: str) -> bool:
+        """Checks if a matched address lies outside the excluded ranges.
 
-        The regex uses negative lookaheads to exclude private and reserved
-        IP ranges (RFC 1918, RFC 3927) from the detection results.
+        Args:
+            address (str): A dotted-quad address, optionally followed by a port.
 
         Returns:
-            List[Pattern]: A list of compiled regular expression patterns.
+            bool: False for loopback, private and link-local addresses.
         """
-        return [
-            re.compile(self.denylist_ipv4_address, flags=re.IGNORECASE | re.VERBOSE),
-        ]
+        first, second, _ = address.split(".", 2)
+        a, b = int(first), int(second)
+        return not (
+            a == 10
+            or a == 127
+            or (a == 172 and 16 <= b <= 31)
+            or (a == 192 and b == 168)
+            or (a == 169 and b == 254)
+        )
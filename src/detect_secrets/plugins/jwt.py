@@ -1,12 +1,19 @@
 """This plugin finds JWT tokens."""
 
-import base64
+import binascii
 import json
 import re
-from typing import Generator, List, Pattern
+from typing import Generator, Pattern, Tuple
 
 from detect_secrets.plugins.base import RegexBasedDetector
 
+# Maps the URL-safe base64 alphabet onto the standard one, as
+# `base64.urlsafe_b64decode` does before decoding.
+_URLSAFE_TO_STANDARD = bytes.maketrans(b"-_", b"+/")
+
+# Padding appended for each `len(part) % 4`; a remainder of 1 is never valid.
+_PADDING = (b"", b"", b"==", b"===")
+
 
 class JwtTokenDetector(RegexBasedDetector):
     """Scans for JWTs (JSON Web Tokens).
@@ -18,28 +25,17 @@ class JwtTokenDetector(RegexBasedDetector):
        ensuring the header and payload are valid JSON.
     """
 
-    @property
-    def secret_type(self) -> str:
-        """Returns the secret type identifier.
-
-        Returns:
-            str: The string identifier 'JSON Web Token'.
-        """
-        return "JSON Web Token"
-
-    @property
-    def denylist(self) -> List[Pattern]:
-        """Returns the list of regex patterns to search for.
+    secret_type = "JSON Web Token"
 
-        This looks for strings starting with 'eyJ' (Base64 for '{"'), followed by
-        Base64 characters, a dot, and more Base64 characters.
+    required_substrings = ("eyJ",)
 
-        Returns:
-            List[Pattern]: A list of compiled regular expression patterns.
-        """
-        return [
-            re.compile(r"eyJ[A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*?"),
-        ]
+    # This looks for strings starting with 'eyJ' (Base64 for '{"'), followed by
+    # Base64 characters, a dot, and more Base64 characters.
+    # The runs are possessive: neither can contain the '.' that follows it, so giving
+    # characters back never helps a match.
+    denylist: Tuple[Pattern, ...] = (
+        re.compile(r"eyJ[A-Za-z0-9-_=]++\.[A-Za-z0-9-_=]++\.?"),
+    )
 
     def analyze_string(self, string: str, **kwargs) -> Generator[str, None, None]:
         """Yields valid JWTs found in the string.
@@ -80,18 +76,15 @@ class JwtTokenDetector(RegexBasedDetector):
         """
         parts = token.split(".")
         for idx, part_str in enumerate(parts):
+            # https://github.com/magical/jwt-python/blob/2fd976b41111031313107792b40d5cfd1a8baf90/jwt.py#L49
+            # https://github.com/jpadilla/pyjwt/blob/3d47b0ea9e5d489f9c90ee6dde9e3d9d69244e3a/jwt/utils.py#L33
+            m = len(part_str) % 4
+            if m == 1:
+                return False
+
             try:
-                part = part_str.encode("ascii")
-                # https://github.com/magical/jwt-python/blob/2fd976b41111031313107792b40d5cfd1a8baf90/jwt.py#L49
-                # https://github.com/jpadilla/pyjwt/blob/3d47b0ea9e5d489f9c90ee6dde9e3d9d69244e3a/jwt/utils.py#L33
-                m = len(part) % 4
-                if m == 1:
-                    raise TypeError("Incorrect padding")
-                elif m == 2:
-                    part += "==".encode("utf-8")
-                elif m == 3:
-                    part += "===".encode("utf-8")
-                b64_decoded = base64.urlsafe_b64decode(part)
+                part = part_str.encode("ascii").translate(_URLSAFE_TO_STANDARD)
+                b64_decoded = binascii.a2b_base64(part + _PADDING[m])
                 if idx < 2:
                     _ = json.loads(b64_decoded.decode("utf-8"))
             except (TypeError, ValueError, UnicodeDecodeError):
@@ -26,7 +26,7 @@ THE SOFTWARE.
 """
 
 import re
-from typing import Any, Dict, Generator, Optional, Pattern, Set
+from typing import Any, Dict, Generator, List, Optional, Pattern
 
 from detect_secrets.core.potential_secret import PotentialSecret
 from detect_secrets.plugins.base import BasePlugin
@@ -242,14 +242,7 @@ class KeywordDetector(BasePlugin):
     purpose detector derived from Bandit.
     """
 
-    @property
-    def secret_type(self) -> str:
-        """Returns the secret type identifier.
-
-        Returns:
-            str: The string identifier 'Secret Keyword'.
-        """
-        return "Secret Keyword"
+    secret_type = "Secret Keyword"
 
     def __init__(self, keyword_exclude: Optional[str] = None) -> None:
         """Initializes the KeywordDetector.
@@ -315,7 +308,7 @@ class KeywordDetector(BasePlugin):
         self,
         line: str,
         **kwargs: Any,
-    ) -> Set[PotentialSecret]:
+    ) -> List[PotentialSecret]:
         """Examines a line and finds all possible secret values in it.
 
         Args:
@@ -323,7 +316,7 @@ class KeywordDetector(BasePlugin):
             **kwargs: Arbitrary keyword arguments passed to analyze_string.
 
         Returns:
-            Set[PotentialSecret]: A set of PotentialSecret objects found in the line.
+            List[PotentialSecret]: A list of PotentialSecret objects found in the line.
         """
         return super().analyze_line(
             line=line,
@@ -1,7 +1,7 @@
 """This plugin searches for Mailchimp keys."""
 
 import re
-from typing import List, Pattern
+from typing import Pattern, Tuple
 
 from detect_secrets.plugins.base import RegexBasedDetector
 
@@ -13,27 +13,12 @@ class MailchimpDetector(RegexBasedDetector):
     hexadecimal string followed by a data center suffix (e.g., `xxxxxxxx-us19`).
     """
 
-    @property
-    def secret_type(self) -> str:
-        """Returns the secret type identifier.
-
-        Returns:
-            str: The string identifier 'Mailchimp Access Key'.
-        """
-        return "Mailchimp Access Key"
-
-    @property
-    def denylist(self) -> List[Pattern]:
-        """Returns the list of regex patterns to search for.
-
-        The pattern looks for:
-        1. 32 lowercase hexadecimal characters.
-        2. A literal '-us' suffix.
-        3. A 1 or 2 digit data center identifier.
-
-        Returns:
-            List[Pattern]: A list of compiled regular expression patterns.
-        """
-        return [
-            re.compile(r"[0-9a-z]{32}-us[0-9]{1,2}"),
-        ]
+    secret_type = "Mailchimp Access Key"
+
+    required_substrings = ("-us",)
+
+    # The pattern looks for:
+    # 1. 32 lowercase hexadecimal characters.
+    # 2. A literal '-us' suffix.
+    # 3. A 1 or 2 digit data center identifier.
+    denylist: Tuple[Pattern, ...] = (re.compile(r"[0-9a-z]{32}-us[0-9]{1,2}"),)
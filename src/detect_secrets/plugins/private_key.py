@@ -26,7 +26,7 @@ THE SOFTWARE.
 """
 
 import re
-from typing import List, Pattern
+from typing import Pattern, Tuple
 
 from detect_secrets.plugins.base import RegexBasedDetector
 
@@ -38,45 +38,32 @@ class PrivateKeyDetector(RegexBasedDetector):
     (Begin/End blocks) and other common key file markers (like PuTTY).
     """
 
-    @property
-    def secret_type(self) -> str:
-        """Returns the secret type identifier.
+    secret_type = "Private Key"
 
-        Returns:
-            str: The string identifier 'Private Key'.
-        """
-        return "Private Key"
+    required_substrings = ("BEGIN ", "PuTTY-User-Key-File-2")
 
-    @property
-    def denylist(self) -> List[Pattern]:
-        """Returns the list of regex patterns to search for.
-
-        The patterns target the header lines typical of private key files,
-        which provides high-confidence detection with low false positives.
-
-        Supported formats:
-        - DSA Private Keys
-        - EC (Elliptic Curve) Private Keys
-        - OpenSSH Private Keys (modern format)
-        - PGP Private Key Blocks
-        - Generic Private Keys (PKCS#8)
-        - RSA Private Keys
-        - SSH2 Encrypted Private Keys
-        - PuTTY User Key Files (Version 2)
-
-        Returns:
-            List[Pattern]: A list of compiled regular expression patterns.
-        """
-        return [
-            re.compile(regexp)
-            for regexp in (
-                r"BEGIN DSA PRIVATE KEY",
-                r"BEGIN EC PRIVATE KEY",
-                r"BEGIN OPENSSH PRIVATE KEY",
-                r"BEGIN PGP PRIVATE KEY BLOCK",
-                r"BEGIN PRIVATE KEY",
-                r"BEGIN RSA PRIVATE KEY",
-                r"BEGIN SSH2 ENCRYPTED PRIVATE KEY",
-                r"PuTTY-User-Key-File-2",
-            )
-        ]
+    # The patterns target the header lines typical of private key files,
+    # which provides high-confidence detection with low false positives.
+    #
+    # Supported formats:
+    # - DSA Private Keys
+    # - EC (Elliptic Curve) Private Keys
+    # - OpenSSH Private Keys (modern format)
+    # - PGP Private Key Blocks
+    # - Generic Private Keys (PKCS#8)
+    # - RSA Private Keys
+    # - SSH2 Encrypted Private Keys
+    # - PuTTY User Key Files (Version 2)
+    denylist: Tuple[Pattern, ...] = tuple(
+        re.compile(regexp)
+        for regexp in (
+            r"BEGIN DSA PRIVATE KEY",
+            r"BEGIN EC PRIVATE KEY",
+            r"BEGIN OPENSSH PRIVATE KEY",
+            r"BEGIN PGP PRIVATE KEY BLOCK",
+            r"BEGIN PRIVATE KEY",
+            r"BEGIN RSA PRIVATE KEY",
+            r"BEGIN SSH2 ENCRYPTED PRIVATE KEY",
+            r"PuTTY-User-Key-File-2",
+        )
+    )
@@ -1,7 +1,7 @@
 """This plugin searches for PyPI tokens."""
 
 import re
-from typing import List, Pattern
+from typing import Pattern, Tuple
 
 from detect_secrets.plugins.base import RegexBasedDetector
 
@@ -14,36 +14,24 @@ class PypiTokenDetector(RegexBasedDetector):
     and the TestPyPI registry.
     """
 
-    @property
-    def secret_type(self) -> str:
-        """Returns the secret type identifier.
-
-        Returns:
-            str: The string identifier 'PyPI Token'.
-        """
-        return "PyPI Token"
-
-    @property
-    def denylist(self) -> List[Pattern]:
-        """Returns the list of regex patterns to search for.
-
-        The patterns target the unique structure of PyPI Macaroons:
-        1. Prefix: `pypi-`
-        2. Scope/Service Identifier (Base64 encoded):
-           - `AgEIcHlwaS5vcmc`: Encodes 'pypi.org' (Production)
-           - `AgENdGVzdC5weXBpLm9yZw`: Encodes 'test.pypi.org' (Test)
-        3. Payload: 70+ URL-safe base64 characters.
-
-        Reference:
-            https://warehouse.pypa.io/development/token-scanning.html
-
-        Returns:
-            List[Pattern]: A list of compiled regular expression patterns.
-        """
-        return [
-            # refs https://warehouse.pypa.io/development/token-scanning.html
-            # pypi.org token
-            re.compile(r"pypi-AgEIcHlwaS5vcmc[A-Za-z0-9-_]{70,}"),
-            # test.pypi.org token
-            re.compile(r"pypi-AgENdGVzdC5weXBpLm9yZw[A-Za-z0-9-_]{70,}"),
-        ]
+    secret_type = "PyPI Token"
+
+    required_substrings = ("pypi-AgE",)
+
+    # The pattern targets the unique structure of PyPI Macaroons:
+    # 1. Prefix: `pypi-`
+    # 2. Scope/Service Identifier (Base64 encoded):
+    #    - `AgEIcHlwaS5vcmc`: Encodes 'pypi.org' (Production)
+    #    - `AgENdGVzdC5weXBpLm9yZw`: Encodes 'test.pypi.org' (Test)
+    # 3. Payload: 70+ URL-safe base64 characters.
+    # Both registries share one pattern, so the text is scanned once for the
+    # common `pypi-AgE` prefix.
+    denylist: Tuple[Pattern, ...] = (
+        # refs https://warehouse.pypa.io/development/token-scanning.html
+        re.compile(
+            r"pypi-AgE"
+            r"(?:IcHlwaS5vcmc"  # pypi.org token
+            r"|NdGVzdC5weXBpLm9yZw)"  # test.pypi.org token
+            r"[A-Za-z0-9-_]{70,}"
+        ),
+    )
@@ -1,7 +1,7 @@
 """This plugin searches for SendGrid API keys."""
 
 import re
-from typing import List, Pattern
+from typing import Pattern, Tuple
 
 from detect_secrets.plugins.base import RegexBasedDetector
 
@@ -13,35 +13,17 @@ class SendGridDetector(RegexBasedDetector):
     implemented by SendGrid.
     """
 
-    @property
-    def secret_type(self) -> str:
-        """Returns the secret type identifier.
+    secret_type = "SendGrid API Key"
 
-        Returns:
-            str: The string identifier 'SendGrid API Key'.
-        """
-        return "SendGrid API Key"
+    required_substrings = ("SG.",)
 
-    @property
-    def denylist(self) -> List[Pattern]:
-        """Returns the list of regex patterns to search for.
-
-
-
-        The pattern enforces the official SendGrid key architecture:
-        1. Prefix: `SG.`
-        2. Key ID: 22 characters (Base64-like alphanumeric + `_` `-`).
-        3. Separator: `.`
-        4. Secret: 43 characters (Base64-like alphanumeric + `_` `-`).
-
-        Reference:
-            https://d2w67tjf43xwdp.cloudfront.net/Classroom/Basics/API/what_is_my_api_key.html
-
-        Returns:
-            List[Pattern]: A list of compiled regular expression patterns.
-        """
-        return [
-            # SendGrid API key
-            # ref. https://d2w67tjf43xwdp.cloudfront.net/Classroom/Basics/API/what_is_my_api_key.html
-            re.compile(r"SG\.[a-zA-Z0-9_-]{22}\.[a-zA-Z0-9_-]{43}"),
-        ]
+    # The pattern enforces the official SendGrid key architecture:
+    # 1. Prefix: `SG.`
+    # 2. Key ID: 22 characters (Base64-like alphanumeric + `_` `-`).
+    # 3. Separator: `.`
+    # 4. Secret: 43 characters (Base64-like alphanumeric + `_` `-`).
+    denylist: Tuple[Pattern, ...] = (
+        # SendGrid API key
+        # ref. https://d2w67tjf43xwdp.cloudfront.net/Classroom/Basics/API/what_is_my_api_key.html
+        re.compile(r"SG\.[a-zA-Z0-9_-]{22}\.[a-zA-Z0-9_-]{43}"),
+    )
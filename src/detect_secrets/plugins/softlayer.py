@@ -1,7 +1,7 @@
 """This plugin searches for SoftLayer credentials."""
 
 import re
-from typing import List, Pattern
+from typing import Pattern, Tuple
 
 from detect_secrets.plugins.base import RegexBasedDetector
 
@@ -13,40 +13,25 @@ class SoftlayerDetector(RegexBasedDetector):
     alphanumeric strings) in both variable assignments and direct SOAP API URLs.
     """
 
-    @property
-    def secret_type(self) -> str:
-        """Returns the secret type identifier.
+    secret_type = "SoftLayer Credentials"
 
-        Returns:
-            str: The string identifier 'SoftLayer Credentials'.
-        """
-        return "SoftLayer Credentials"
-
-    sl = r"(?:softlayer|sl)(?:_|-|)(?:api|)"
+    sl = r"(?:softlayer|sl)[-_]?(?:api)?"
     key_or_pass = r"(?:key|pwd|password|pass|token)"
     secret = r"([a-z0-9]{64})"
 
-    @property
-    def denylist(self) -> List[Pattern]:
-        """Returns the list of regex patterns to search for.
-
-        The patterns look for:
-        1.  **Assignments:** Variables with names containing 'softlayer' or 'sl'
-            assigned to a 64-character lowercase alphanumeric string.
-        2.  **SOAP URLs:** API keys embedded directly in SoftLayer SOAP API endpoints
-            (e.g., `api.softlayer.com/soap/v3/KEY`).
-
-        Returns:
-            List[Pattern]: A list of compiled regular expression patterns.
-        """
-        return [
-            RegexBasedDetector.build_assignment_regex(
-                prefix_regex=self.sl,
-                secret_keyword_regex=self.key_or_pass,
-                secret_regex=self.secret,
-            ),
-            re.compile(
-                r"(?:http|https)://api.softlayer.com/soap/(?:v3|v3.1)/([a-z0-9]{64})",
-                flags=re.IGNORECASE,
-            ),
-        ]
+    # The patterns look for:
+    # 1.  Assignments: Variables with names containing 'softlayer' or 'sl'
+    #     assigned to a 64-character lowercase alphanumeric string.
+    # 2.  SOAP URLs: API keys embedded directly in SoftLayer SOAP API endpoints
+    #     (e.g., `api.softlayer.com/soap/v3/KEY`).
+    denylist: Tuple[Pattern, ...] = (
+        RegexBasedDetector.build_assignment_regex(
+            prefix_regex=sl,
+            secret_keyword_regex=key_or_pass,
+            secret_regex=secret,
+        ),
+        re.compile(
+            r"https?://api\.softlayer\.com/soap/v3(?:\.1)?/([a-z0-9]{64})",
+            flags=re.IGNORECASE,
+        ),
+    )
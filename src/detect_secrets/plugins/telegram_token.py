@@ -1,7 +1,7 @@
 """This plugin searches for Telegram bot tokens."""
 
 import re
-from typing import List, Pattern
+from typing import Pattern, Tuple
 
 from detect_secrets.plugins.base import RegexBasedDetector
 
@@ -13,36 +13,21 @@ class TelegramBotTokenDetector(RegexBasedDetector):
     authentication mechanism for the Telegram Bot API.
     """
 
-    @property
-    def secret_type(self) -> str:
-        """Returns the secret type identifier.
-
-        Returns:
-            str: The string identifier 'Telegram Bot Token'.
-        """
-        return "Telegram Bot Token"
-
-    @property
-    def denylist(self) -> List[Pattern]:
-        """Returns the list of regex patterns to search for.
-
-        The pattern enforces the standard Telegram token structure:
-        1. Bot ID: 8 to 10 digits.
-        2. Separator: Colon `:`.
-        3. Secret: 35 alphanumeric characters (including `_` and `-`).
-
-        Note:
-            This regex uses start (^) and end ($) anchors, meaning it currently
-            only detects tokens that occupy the entire analyzed string (e.g.,
-            exact matches in a configuration file).
-
-        Reference:
-            https://core.telegram.org/bots/api#authorizing-your-bot
-
-        Returns:
-            List[Pattern]: A list of compiled regular expression patterns.
-        """
-        return [
-            # refs https://core.telegram.org/bots/api#authorizing-your-bot
-            re.compile(r"^\d{8,10}:[0-9A-Za-z_-]{35}$"),
-        ]
+    secret_type = "Telegram Bot Token"
+
+    required_substrings = (":",)
+
+    # The pattern enforces the standard Telegram token structure:
+    # 1. Bot ID: 8 to 10 digits.
+    # 2. Separator: Colon `:`.
+    # 3. Secret: 35 alphanumeric characters (including `_` and `-`).
+    #
+    # Tokens are found anywhere in the analyzed string. Lookarounds stand in for word
+    # boundaries, so the Bot ID and secret cannot be part of longer runs (`\b` would
+    # misbehave next to a trailing `-`). The pattern starts with a plain `\d`, and the
+    # lookbehind then checks the character before it, so the engine can skip ahead to
+    # digits instead of testing the lookbehind at every position.
+    denylist: Tuple[Pattern, ...] = (
+        # refs https://core.telegram.org/bots/api#authorizing-your-bot
+        re.compile(r"\d(?<!\w\d)\d{7,9}:[0-9A-Za-z_-]{35}(?![\w-])"),
+    )
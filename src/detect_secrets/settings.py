@@ -1,5 +1,5 @@
-from functools import lru_cache
-from typing import List
+import threading
+from typing import Optional, Tuple
 
 from detect_secrets.filters.base_secret_filter import BaseSecretFilter
 from detect_secrets.filters.filters import (
@@ -40,48 +40,67 @@ from detect_secrets.plugins import (
     TwilioKeyDetector,
 )
 
+# Built on first use and shared afterwards; tuples, so callers cannot mutate them.
+# First use is guarded by double-checked locking, so concurrent callers share one
+# set of instances; later calls never touch the lock.
+_plugins: Optional[Tuple[BasePlugin, ...]] = None
+_filters: Optional[Tuple[BaseSecretFilter, ...]] = None
+_lock = threading.Lock()
 
-@lru_cache(maxsize=1)
-def get_plugins() -> List[BasePlugin]:
-    return [
-        ArtifactoryDetector(),
-        AWSKeyDetector(),
-        AzureStorageKeyDetector(),
-        Base64HighEntropyString(),
-        BasicAuthDetector(),
-        CloudantDetector(),
-        DiscordBotTokenDetector(),
-        GitHubTokenDetector(),
-        GitLabTokenDetector(),
-        HexHighEntropyString(),
-        IbmCloudIamDetector(),
-        IbmCosHmacDetector(),
-        IPPublicDetector(),
-        JwtTokenDetector(),
-        KeywordDetector(),
-        MailchimpDetector(),
-        NpmDetector(),
-        OpenAIDetector(),
-        PrivateKeyDetector(),
-        PypiTokenDetector(),
-        SendGridDetector(),
-        SlackDetector(),
-        SoftlayerDetector(),
-        SquareOAuthDetector(),
-        StripeDetector(),
-        TelegramBotTokenDetector(),
-        TwilioKeyDetector(),
-    ]
 
+def get_plugins() -> Tuple[BasePlugin, ...]:
+    global _plugins
+    if _plugins is not None:
+        return _plugins
 
-@lru_cache(maxsize=1)
-def get_filters() -> List[BaseSecretFilter]:
-    filters = [
-        SequentialStringFilter(),
-        UUIDFilter(),
-        TemplatedSecretFilter(),
-        NotAlphanumericFilter(),
-        GibberishFilter(),
-    ]
+    with _lock:
+        if _plugins is None:
+            _plugins = (
+                ArtifactoryDetector(),
+                AWSKeyDetector(),
+                AzureStorageKeyDetector(),
+                Base64HighEntropyString(),
+                BasicAuthDetector(),
+                CloudantDetector(),
+                DiscordBotTokenDetector(),
+                GitHubTokenDetector(),
+                GitLabTokenDetector(),
+                HexHighEntropyString(),
+                IbmCloudIamDetector(),
+                IbmCosHmacDetector(),
+                IPPublicDetector(),
+                JwtTokenDetector(),
+                KeywordDetector(),
+                MailchimpDetector(),
+                NpmDetector(),
+                OpenAIDetector(),
+                PrivateKeyDetector(),
+                PypiTokenDetector(),
+                SendGridDetector(),
+                SlackDetector(),
+                SoftlayerDetector(),
+                SquareOAuthDetector(),
+                StripeDetector(),
+                TelegramBotTokenDetector(),
+                TwilioKeyDetector(),
+            )
 
-    return filters
+    return _plugins
+
+
+def get_filters() -> Tuple[BaseSecretFilter, ...]:
+    global _filters
+    if _filters is not None:
+        return _filters
+
+    with _lock:
+        if _filters is None:
+            _filters = (
+                SequentialStringFilter(),
+                UUIDFilter(),
+                TemplatedSecretFilter(),
+                NotAlphanumericFilter(),
+                GibberishFilter(),
+            )
+
+    return _filters
@@ -3,7 +3,7 @@ from typing import Deque, List, Optional
 from uuid import UUID
 
 from langgraph.graph import END, START, MessagesState
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Node(str, Enum):
@@ -20,6 +20,8 @@ class Node(str, Enum):
 
 
 class Substep(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     description: str = Field(
         description="A description of the action to be performed within a step."
     )
@@ -30,6 +32,8 @@ class Substep(BaseModel):
 
 
 class Step(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     description: str = Field(
         description="A description of the step in the installation or execution process."
     )
@@ -50,6 +54,8 @@ class Step(BaseModel):
 
 
 class FinishedStep(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     step: Step = Field(description="The original step definition that was executed.")
     output: Optional[str] = Field(
         default=None,
@@ -62,6 +68,8 @@ class FinishedStep(BaseModel):
 
 
 class FailedStep(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     step: Step = Field(
         description="The original step definition that failed to complete successfully."
     )
@@ -70,11 +78,15 @@ class FailedStep(BaseModel):
 
 
 class GuidelineFile(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     file: str = Field(description="The relative path to the documentation file.")
     content: str = Field(description="The full raw text content of the file.")
 
 
 class WorkflowError(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     description: str = Field(
         description="A summary of where the workflow logic broke down."
     )
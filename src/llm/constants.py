@@ -8,3 +8,7 @@ class SuggestedModels(str, Enum):
 
 
 DEFAULT_MODEL = SuggestedModels.CLAUDE_SONNET_4_5
+
+# Upper bound on concurrent requests issued by `StructuredLLM.batch`, to stay
+# within provider rate limits.
+DEFAULT_MAX_CONCURRENCY = 8
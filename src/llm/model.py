@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, TypedDict, cast
+from typing import Any, Optional, Tuple, TypedDict, cast
 
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -30,7 +30,7 @@ class LLMParams(TypedDict, total=False):
 class LLMManager(metaclass=SingletonMeta):
     """Singleton class for managing a shared LLM instance.
 
-    Lazily initializes the model and allows re-initialization via CLI or code
+    Builds the model when initialized and allows re-initialization via CLI or code
     to switch configurations globally.
 
     Attributes:
@@ -40,6 +40,7 @@ class LLMManager(metaclass=SingletonMeta):
         _temperature (Optional[float]): Configured temperature.
         _timeout (Optional[float]): Configured timeout.
         _max_retries (Optional[int]): Configured max retries.
+        _config_key (Tuple[Any, ...]): The configuration `_llm` was (or will be) built from.
     """
 
     def __init__(
@@ -59,12 +60,38 @@ class LLMManager(metaclass=SingletonMeta):
             timeout (Optional[float]): The request timeout. Defaults to None.
             max_retries (Optional[int]): The maximum retries. Defaults to None.
         """
+        self._configure(model, max_tokens, temperature, timeout, max_retries)
+
+    def _configure(
+        self,
+        model: str,
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        timeout: Optional[float],
+        max_retries: Optional[int],
+    ) -> None:
+        """Stores the configuration settings and drops any model built from older ones.
+
+        Args:
+            model (str): The model name.
+            max_tokens (Optional[int]): The maximum tokens to generate.
+            temperature (Optional[float]): The sampling temperature.
+            timeout (Optional[float]): The request timeout.
+            max_retries (Optional[int]): The maximum retries.
+        """
         self._model_name = model
-        self._llm: Optional[BaseChatModel] = None
         self._max_tokens = max_tokens
         self._temperature = temperature
         self._timeout = timeout
         self._max_retries = max_retries
+        self._config_key: Tuple[Any, ...] = (
+            model,
+            max_tokens,
+            temperature,
+            timeout,
+            max_retries,
+        )
+        self._llm: Optional[BaseChatModel] = None
 
     @classmethod
     def init(
@@ -78,6 +105,8 @@ class LLMManager(metaclass=SingletonMeta):
         """Initialize or reinitialize the singleton with specific model parameters.
 
         Only parameters explicitly provided (not None) will be passed to the factory.
+        The model client is constructed here, so the first LLM call does not pay for it.
+        Calling this again with the same parameters keeps the existing client.
 
         Args:
             model (str): The model name. Defaults to DEFAULT_MODEL.
@@ -97,6 +126,14 @@ class LLMManager(metaclass=SingletonMeta):
             max_retries=max_retries,
         )
 
+        # The singleton metaclass only runs `__init__` for the first instance, so
+        # later calls apply their configuration here, and only when it changed.
+        config_key = (model, max_tokens, temperature, timeout, max_retries)
+        if instance._config_key != config_key:
+            instance._configure(*config_key)
+
+        instance.get_llm()
+
         return instance
 
     @classmethod
@@ -152,3 +189,21 @@ class LLMManager(metaclass=SingletonMeta):
     @property
     def model_name(self) -> str:
         return self._model_name
+
+    @property
+    def config_key(self) -> Tuple[Any, ...]:
+        """The full configuration the model is built from.
+
+        Returns:
+            Tuple[Any, ...]: Model name, max tokens, temperature, timeout and max retries.
+        """
+        return self._config_key
+
+    @property
+    def temperature(self) -> Optional[float]:
+        """The configured sampling temperature, or None for the provider default.
+
+        Returns:
+            Optional[float]: The temperature passed to the model.
+        """
+        return self._temperature
@@ -1,14 +1,68 @@
-from typing import List, Type, TypeVar
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, cast
 
+from langchain_core.language_models import LanguageModelInput
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import AnyMessage
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
 from pydantic import BaseModel
 
+from llm.constants import DEFAULT_MAX_CONCURRENCY
 from llm.model import LLMManager
 
 T = TypeVar("T", bound=BaseModel)
 
+# Responses to earlier `StructuredLLM.invoke` calls, least recently used first. Keys are
+# the schema and a digest of the model configuration and prompt, so large inputs are not
+# retained. Entries are private copies: callers only ever receive copies of them.
+_RESPONSE_CACHE_SIZE = 4096
+_response_cache: OrderedDict[Tuple[type, bytes], BaseModel] = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _prompt_digest(
+    config_key: Tuple[Any, ...], system_message: str, input_text: str
+) -> bytes:
+    """Returns a 128-bit digest identifying a prompt sent to a configured model.
+
+    Args:
+        config_key (Tuple[Any, ...]): The configuration of the model the prompt is sent to.
+        system_message (str): The system prompt.
+        input_text (str): The input text.
+
+    Returns:
+        bytes: The digest.
+    """
+    return blake2b(
+        "\0".join((repr(config_key), system_message, input_text)).encode(),
+        digest_size=16,
+    ).digest()
+
+
+@lru_cache(maxsize=128)
+def _build_prompt(system_message: str) -> ChatPromptTemplate:
+    """Builds the prompt template for a system message, reused across calls.
+
+    Args:
+        system_message (str): The system prompt to guide the LLM's behavior.
+
+    Returns:
+        ChatPromptTemplate: A template with the system message and an `{input}` slot.
+    """
+    # The fixed reminder goes first, so that calls with different system messages
+    # still share a prompt prefix for provider-side prompt caching.
+    system_message = (
+        "IMPORTANT: Always return valid JSON that conforms to the schema.\n\n"
+        + system_message
+    )
+
+    return ChatPromptTemplate.from_messages(
+        [("system", system_message), ("human", "{input}")]
+    )
+
 
 class StructuredLLM:
     """Wrapper around BaseChatModel to facilitate structured Pydantic outputs.
@@ -19,6 +73,11 @@ class StructuredLLM:
 
     Attributes:
         _raw_llm (BaseChatModel): The underlying LangChain chat model instance.
+        _structured_llms (Dict[Type[BaseModel], Runnable]): Structured-output runnables
+            built from `_raw_llm`, one per schema.
+        _config_key (Tuple[Any, ...]): The LLMManager configuration `_raw_llm` was built from.
+        _cache_responses (bool): Whether `invoke` reuses responses to identical prompts.
+            Only enabled at temperature 0, where a repeated prompt gets the same answer.
     """
 
     def __init__(self) -> None:
@@ -29,10 +88,33 @@ class StructuredLLM:
         """
         llm_manager = LLMManager.get()
         self._raw_llm = llm_manager.get_llm()
+        self._structured_llms: Dict[Type[BaseModel], Runnable[Any, Any]] = {}
+        self._config_key = llm_manager.config_key
+        self._cache_responses = llm_manager.temperature == 0
+
+    def _get_structured_llm(self, schema: Type[T]) -> Runnable[Any, Any]:
+        """Returns the structured-output runnable for a schema, building it on first use.
+
+        Args:
+            schema (Type[T]): The Pydantic model class defining the expected output structure.
+
+        Returns:
+            Runnable[Any, Any]: The model bound to produce `schema` instances.
+        """
+        structured_llm = self._structured_llms.get(schema)
+        if structured_llm is None:
+            structured_llm = self._raw_llm.with_structured_output(
+                schema, method="json_schema"
+            )
+            self._structured_llms[schema] = structured_llm
+        return structured_llm
 
     def invoke(self, schema: Type[T], system_message: str, input_text: str) -> T:
         """Generates a structured response based on a system prompt and user input.
 
+        At temperature 0, a prompt identical to an earlier one returns a copy of the
+        earlier response without calling the model.
+
         Args:
             schema (Type[T]): The Pydantic model class defining the expected output structure.
             system_message (str): The system prompt to guide the LLM's behavior.
@@ -44,35 +126,77 @@ class StructuredLLM:
         Raises:
             TypeError: If the returned object is not an instance of the provided schema.
         """
-        structured_llm = self._raw_llm.with_structured_output(
-            schema, method="json_schema"
-        )
-
-        system_message = (
-            system_message
-            + "\n\nIMPORTANT: Always return valid JSON that conforms to the schema."
-        )
-
-        prompt = ChatPromptTemplate.from_messages(
-            [("system", system_message), ("human", "{input}")]
-        )
-
-        chain = prompt | structured_llm
+        key: Optional[Tuple[type, bytes]] = None
+        if self._cache_responses:
+            key = (
+                schema,
+                _prompt_digest(self._config_key, system_message, input_text),
+            )
+            with _response_cache_lock:
+                cached = _response_cache.get(key)
+                if cached is not None:
+                    _response_cache.move_to_end(key)
+                    return cast(T, cached.model_copy(deep=True))
+
+        chain = _build_prompt(system_message) | self._get_structured_llm(schema)
         response = chain.invoke({"input": input_text})
 
         if isinstance(response, schema):
+            if key is not None:
+                with _response_cache_lock:
+                    _response_cache[key] = response.model_copy(deep=True)
+                    if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+                        _response_cache.popitem(last=False)
             return response
         else:
             raise TypeError(f"Unexpected return type: {type(response)}")
 
+    def batch(
+        self,
+        schema: Type[T],
+        system_message: str,
+        input_texts: List[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[T]:
+        """Generates structured responses for several independent inputs concurrently.
+
+        Equivalent to calling `invoke` once per input, but the requests are issued
+        in parallel, at most `max_concurrency` at a time.
+
+        Args:
+            schema (Type[T]): The Pydantic model class defining the expected output structure.
+            system_message (str): The system prompt shared by all inputs.
+            input_texts (List[str]): The input texts to be processed.
+            max_concurrency (int): The maximum number of requests in flight.
+                Defaults to DEFAULT_MAX_CONCURRENCY.
+
+        Returns:
+            List[T]: One instance of the provided Pydantic model class per input, in order.
+
+        Raises:
+            TypeError: If any returned object is not an instance of the provided schema.
+        """
+        chain = _build_prompt(system_message) | self._get_structured_llm(schema)
+        responses = chain.batch(
+            [{"input": input_text} for input_text in input_texts],
+            config={"max_concurrency": max_concurrency},
+        )
+
+        for response in responses:
+            if not isinstance(response, schema):
+                raise TypeError(f"Unexpected return type: {type(response)}")
+        return responses
+
     def invoke_with_messages_list(
-        self, schema: Type[T], messages: List[AnyMessage]
+        self, schema: Type[T], messages: LanguageModelInput
     ) -> T:
         """
         Invoke the LLM with a structured output schema over a list of messages.
+        The messages go straight to the model, without a prompt template.
         Args:
             schema (Type[T]): The Pydantic model class defining the expected output structure.
-            messages (List[AnyMessage]): The list of messages.
+            messages (LanguageModelInput): The list of messages. A plain string (sent as a
+                single human message) or an already formatted prompt value is also accepted.
 
         Returns:
             T: An instance of the provided Pydantic model class populated with the LLM's response.
@@ -80,11 +204,7 @@ class StructuredLLM:
         Raises:
             TypeError: If the returned object is not an instance of the provided schema.
         """
-        structured_llm = self._raw_llm.with_structured_output(
-            schema, method="json_schema"
-        )
-
-        response = structured_llm.invoke(messages)
+        response = self._get_structured_llm(schema).invoke(messages)
         if isinstance(response, schema):
             return response
         else:
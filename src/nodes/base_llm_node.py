@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Type, TypeVar, Union
+from typing import Generic, List, Type, TypeVar, Union
 
 from langchain.agents import AgentState
 from langgraph.graph import MessagesState
@@ -35,6 +35,18 @@ class BaseLLMNode(ABC, Generic[K]):
             schema=schema, system_message=system_message, input_text=input_text
         )
 
+    def _batch_structured_llm(
+        self, schema: Type[T], system_message: str, input_texts: List[str]
+    ) -> List[T]:
+        """
+        Invoke the LLM with a structured output schema for several independent inputs.
+        The requests are issued concurrently.
+        Returns one parsed Pydantic object (schema) per input, in order.
+        """
+        return self._llm.batch(
+            schema=schema, system_message=system_message, input_texts=input_texts
+        )
+
     @abstractmethod
     def invoke(self, state: K) -> K:
         """
@@ -90,7 +90,7 @@ class GuidelinesRetrieverNode(BaseLLMNode):
         Returns:
             List[GuidelineFile]: A list of GuidelineFile objects containing the path and content of confirmed guidelines.
         """
-        guideline_files: List[GuidelineFile] = []
+        candidates: List[GuidelineFile] = []
 
         for file in files:
             content = self._file_loader.load_document(
@@ -99,18 +99,23 @@ class GuidelinesRetrieverNode(BaseLLMNode):
             if not content.strip():
                 continue
 
-            input_text = f"File path: {file}\nContent Preview:\n{content}"
+            candidates.append(GuidelineFile(file=file, content=content))
 
-            result: GuidelineFileCheck = self._invoke_structured_llm(
-                GuidelineFileCheck,
-                GuidelinesRetrieverPrompts.CHECK_FILE_CONTENT.value,
-                input_text,
-            )
-
-            if result.is_guideline:
-                guideline_files.append(GuidelineFile(file=file, content=content))
+        # Each file is checked on its own, so the checks are sent concurrently.
+        results: List[GuidelineFileCheck] = self._batch_structured_llm(
+            GuidelineFileCheck,
+            GuidelinesRetrieverPrompts.CHECK_FILE_CONTENT.value,
+            [
+                f"File path: {candidate.file}\nContent Preview:\n{candidate.content}"
+                for candidate in candidates
+            ],
+        )
 
-        return guideline_files
+        return [
+            candidate
+            for candidate, result in zip(candidates, results)
+            if result.is_guideline
+        ]
 
     def _collect_supported_files(self) -> List[str]:
         """